@@ -93,8 +93,8 @@ class CitrineDataRetrieval(BaseDataRetrieval):
         all_fields = []
         for prop_counter, requested_prop in enumerate(properties):
             jsons = self.get_data(prop=requested_prop, **criteria)
-            non_prop_df = pd.DataFrame()  # df w/o measurement column
-            prop_df = pd.DataFrame()  # df containing only measurement column
+            non_prop_rows = []  # dfs w/o measurement column
+            prop_rows = []  # dfs containing only measurement column
             counter = 0  # variable to keep count of sample hit and set indexes
             for hit in tqdm(jsons):
                 counter += 1
@@ -107,7 +107,7 @@ class CitrineDataRetrieval(BaseDataRetrieval):
                     for col in non_prop_cols:
                         non_prop_row[col] = system_normdf[col]
                     non_prop_row.index = [counter] * len(system_normdf)
-                    non_prop_df = non_prop_df.append(non_prop_row)
+                    non_prop_rows.append(non_prop_row)
                     if "properties" in system_value:
                         p_df = pd.DataFrame()
                         # Rename duplicate property names in a record with progressive numbering
@@ -150,7 +150,14 @@ class CitrineDataRetrieval(BaseDataRetrieval):
                                         "name"] + "-" + prop_key] = prop[
                                         prop_key]
                         p_df.index = [counter]
-                        prop_df = prop_df.append(p_df)
+                        prop_rows.append(p_df)
+
+            # Concatenate all rows at once instead of growing a dataframe
+            #   (and copying it) with every hit
+            non_prop_df = pd.concat(non_prop_rows, sort=False) \
+                if non_prop_rows else pd.DataFrame()
+            prop_df = pd.concat(prop_rows, sort=False) \
+                if prop_rows else pd.DataFrame()
             df_prop = pd.concat([non_prop_df, prop_df], axis=1)
             if prop_counter == 0:
                 optcomcols = df_prop.columns.values
@@ -47,15 +47,16 @@ class MongoDataRetrieval(BaseDataRetrieval):
 
         r = self.coll.find(criteria, query_proj, sort=sort).limit(limit)
 
+        # split up dot-notation keys once, rather than for every document
+        key_paths = [[int(v) if is_int(v) else v for v in key.split('.')]
+                     for key in properties]
+
         all_data = []  # matrix of row, column data
         for d in tqdm(r):
             row_data = []
 
-            # split up dot-notation keys
-            for key in properties:
+            for vals in key_paths:
                 try:
-                    vals = key.split('.')
-                    vals = [int(v) if is_int(v) else v for v in vals]
                     data = reduce(lambda e, k: e[k], vals, d)
                     row_data.append(data)
                 except:
@@ -1202,15 +1202,17 @@ class GaussianSymmFunc(BaseFeaturizer):
         Gaussian radial symmetry function of the center atom,
         given an eta parameter.
         Args:
-            eta: radial function parameter.
+            eta (float or [float]): radial function parameter(s). If a list
+                is given, the functions for all etas are evaluated at once.
             rs: distances from the central atom to each neighbor
             cutoff (float): cutoff distance.
         Returns:
-            (float) Gaussian radial symmetry function.
+            (float or ndarray) Gaussian radial symmetry function, with one
+                entry per eta if a list of etas is given.
         """
-        ridge = (np.exp(-eta * (rs ** 2.) / (cutoff ** 2.)) *
+        ridge = (np.exp(-np.multiply.outer(eta, rs ** 2.) / (cutoff ** 2.)) *
                  GaussianSymmFunc.cosine_cutoff(rs, cutoff))
-        return ridge.sum()
+        return ridge.sum(axis=-1)
 
     @staticmethod
     def g4(etas, zetas, gammas, neigh_dist, neigh_coords, cutoff):
@@ -1270,8 +1272,6 @@ class GaussianSymmFunc(BaseFeaturizer):
         Returns:
             (list of floats): Gaussian symmetry function features.
         """
-        gaussian_funcs = []
-
         # Get the neighbors within the cutoff
         neighbors = struct.get_neighbors(struct[idx], self.cutoff)
 
@@ -1282,8 +1282,8 @@ class GaussianSymmFunc(BaseFeaturizer):
         neigh_dists = np.array([neigh[1] for neigh in neighbors])
 
         # Compute all G2
-        for eta_g2 in self.etas_g2:
-            gaussian_funcs.append(self.g2(eta_g2, neigh_dists, self.cutoff))
+        gaussian_funcs = self.g2(self.etas_g2, neigh_dists,
+                                 self.cutoff).tolist()
 
         # Compute all G4s
         gaussian_funcs.extend(GaussianSymmFunc.g4(self.etas_g4, self.zetas_g4, self.gammas_g4,
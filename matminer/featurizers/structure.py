@@ -107,9 +107,10 @@ class DensityFeatures(BaseFeaturizer):
         if "packing fraction" in self.features:
             if not s.is_ordered:
                 raise ValueError("Disordered structure support not built yet.")
+            # Look up the radius once per species, not once per site
             total_rad = 0
-            for site in s:
-                total_rad += site.specie.atomic_radius ** 3
+            for specie, amt in s.composition.items():
+                total_rad += amt * specie.atomic_radius ** 3
             output.append(4 * math.pi * total_rad / (3 * s.volume))
 
         return output
@@ -378,7 +379,7 @@ class PartialRadialDistributionFunction(BaseFeaturizer):
         composition = s.composition.fractional_composition.to_reduced_dict
 
         # Get the distances between all atoms
-        neighbors_lst = s.get_all_neighbors(self.cutoff)
+        neighbors_lst = s.get_all_neighbors(self.cutoff, include_index=True)
 
         # Sort neighbors by type
         distances_by_type = {}
@@ -389,13 +390,15 @@ class PartialRadialDistributionFunction(BaseFeaturizer):
             return site.specie.symbol if isinstance(site.specie,
                                                     Element) else site.specie.element.symbol
 
-        for site, nlst in zip(s.sites,
-                              neighbors_lst):  # Each list is a list for each site
-            my_elem = get_symbol(site)
+        # Determine the element of each site once, and look up neighbors
+        #  by their site index rather than re-inspecting their species
+        symbols = [get_symbol(site) for site in s.sites]
 
+        for my_elem, nlst in zip(symbols,
+                                 neighbors_lst):  # Each list is a list for each site
             for neighbor in nlst:
                 rij = neighbor[1]
-                n_elem = get_symbol(neighbor[0])
+                n_elem = symbols[neighbor[2]]
                 # LW 3May17: Any better ideas than appending each element at a time?
                 distances_by_type[(my_elem, n_elem)].append(rij)
 
@@ -516,11 +519,17 @@ class ElectronicRadialDistributionFunction(BaseFeaturizer):
         for site in struct.sites:
             this_charge = float(site.specie.oxi_state)
             neighbors = struct.get_neighbors(site, self.cutoff)
-            for nnsite, dist, *_ in neighbors:
-                neigh_charge = float(nnsite.specie.oxi_state)
-                bin_index = int(dist / self.dr)
-                redf_dict["distribution"][bin_index] \
-                    += (this_charge * neigh_charge) / (struct.num_sites * dist)
+            if len(neighbors) == 0:
+                continue
+
+            # Bin the contributions of all neighbors of this site at once
+            dists = np.array([n[1] for n in neighbors])
+            neigh_charges = np.array(
+                [float(n[0].specie.oxi_state) for n in neighbors])
+            bin_indices = (dists / self.dr).astype(int)
+            np.add.at(redf_dict["distribution"], bin_indices,
+                      (this_charge * neigh_charges) /
+                      (struct.num_sites * dists))
 
         return [redf_dict]
 
@@ -1041,16 +1050,24 @@ class MinimumRelativeDistances(BaseFeaturizer):
                     distances (i.e., for all sites).
         """
         vire = ValenceIonicRadiusEvaluator(s)
+        struct = vire.structure
+
+        # Radius of each site, indexed like the sites of the structure
+        #  vire.radii is rebuilt from all sites on every access, so read it once
+        radii_by_species = vire.radii
+        radii = np.array([radii_by_species[site.species_string]
+                          for site in struct])
+
+        # Get the neighbors of all sites in a single call
+        all_neighbors = struct.get_all_neighbors(self.cutoff,
+                                                 include_index=True)
+
         dists_relative_min = []
-        for site in vire.structure:
-            dists_relative = []
-            for nnsite, dist, *_ in vire.structure.get_neighbors(site, self.cutoff):
-                r_site = vire.radii[site.species_string]
-                r_neigh = vire.radii[nnsite.species_string]
-                radii_dist = r_site + r_neigh
-                d_relative = dist / radii_dist
-                dists_relative.append(d_relative)
-            dists_relative_min.append(min(dists_relative))
+        for i, neighbors in enumerate(all_neighbors):
+            dists = np.array([n[1] for n in neighbors])
+            neigh_idx = np.array([n[2] for n in neighbors], dtype=int)
+            dists_relative_min.append(
+                float(np.min(dists / (radii[i] + radii[neigh_idx]))))
         return [dists_relative_min]
 
     def feature_labels(self):
@@ -1818,16 +1835,15 @@ class BagofBonds(BaseFeaturizer):
             self
         """
         unpadded_bobs = [self.bag(s, return_baglens=True) for s in X]
-        bonds = [list(bob.keys()) for bob in unpadded_bobs]
-        bonds = np.unique(sum(bonds, []))
-        baglens = [0] * len(bonds)
 
-        for i, bond in enumerate(bonds):
-            for bob in unpadded_bobs:
-                if bond in bob:
-                    baglen = bob[bond]
-                    baglens[i] = max((baglens[i], baglen))
-        self.bag_lens = dict(zip(bonds, baglens))
+        # Find the largest bag of each bond type in one pass over the bags
+        max_baglens = {}
+        for bob in unpadded_bobs:
+            for bond, baglen in bob.items():
+                max_baglens[bond] = max(max_baglens.get(bond, 0), baglen)
+
+        bonds = np.unique(list(max_baglens.keys()))
+        self.bag_lens = {bond: max_baglens[bond] for bond in bonds}
         # Sort the bags by bag length, with the shortest coming first.
         self.ordered_bonds = [b[0] for b in sorted(self.bag_lens.items(),
                                                    key=lambda bl: bl[1])]
@@ -2089,8 +2105,10 @@ class MaximumPackingEfficiency(BaseFeaturizer):
 
     def featurize(self, strc):
         # Get the Voronoi tessellation of each site
+        #  Computed for all sites at once, so the tessellation is built
+        #  only a single time
         voro = VoronoiNN()
-        nns = [voro.get_voronoi_polyhedra(strc, i) for i in range(len(strc))]
+        nns = voro.get_all_voronoi_polyhedra(strc)
 
         # Compute the radius of largest possible atom for each site
         #  The largest radius is equal to the distance from the center of the
@@ -2299,10 +2317,9 @@ class XRDPowderPattern(BaseFeaturizer):
         pattern = self.xrd_calc.get_pattern(
             strc, two_theta_range=self.two_theta_range)
         x, y = pattern.x, pattern.y
-        hist = []
-        for x1, y1 in zip(x, y):
-            num = int(y1)
-            hist += [x1] * num
+
+        # Repeat each peak position by its (truncated) intensity
+        hist = np.repeat(x, np.asarray(y).astype(int))
 
         kernel = gaussian_kde(hist, bw_method=self.bw_method)
         x = np.linspace(self.two_theta_range[0], self.two_theta_range[1],
@@ -3335,17 +3352,16 @@ class JarvisCFID(BaseFeaturizer):
                 combinations are included
         """
         neighbors_lst = structure.get_all_neighbors(cutoff)
-        comb = self._element_combinations(structure=structure)
+
+        # Group the neighbor distances by element combination in one pass,
+        #  keyed by the sorted atomic numbers of each pair
         info = {}
-        for c in comb:
-            for i, ii in enumerate(neighbors_lst):
-                for j in ii:
-                    comb1 = str(structure[i].specie) + str('-') + \
-                            str(j[0].specie)
-                    comb2 = str(j[0].specie) + str('-') + \
-                            str(structure[i].specie)
-                    if comb1 == c or comb2 == c:
-                        info.setdefault(c, []).append(j[1])
+        for site, neighbors in zip(structure, neighbors_lst):
+            z_site = site.specie.Z
+            for neighbor in neighbors:
+                z_neigh = neighbor[0].specie.Z
+                key = (min(z_site, z_neigh), max(z_site, z_neigh))
+                info.setdefault(key, []).append(neighbor[1])
         for i in info.items():
             i[1].sort()
         cut_off = {}
@@ -3353,21 +3369,6 @@ class JarvisCFID(BaseFeaturizer):
             cut_off[i] = self._flatten(arr=j, tol=0.1)
         return max(cut_off.items(), key=itemgetter(1))[1]
 
-    @staticmethod
-    def _element_combinations(structure):
-        """
-        Get element combinations for a Structure object
-
-        Args:
-            structure: Structure object
-        Returns:
-               comb: combinations
-          """
-        sym = structure.symbol_set
-        tmp = map('-'.join, itertools.product(sym, repeat=2))
-        comb = list(set([str('-'.join(sorted(i.split('-')))) for i in tmp]))
-        return comb
-
     @staticmethod
     def _get_rdf(structure=None, cutoff=10.0, intvl=0.1):
         """
@@ -3581,16 +3582,38 @@ class GlobalInstabilityIndex(BaseFeaturizer):
 
         return [gii]
 
-    def get_equiv_sites(self, s, site):
-        """Find identical sites from analyzing space group symmetry."""
+    def get_equiv_sites(self, s, site, sym_struct=None):
+        """Find identical sites from analyzing space group symmetry.
+
+        Args:
+            s: Pymatgen Structure object
+            site: Site of s whose equivalent sites are returned
+            sym_struct: (SymmetrizedStructure) Symmetrized form of s. Pass it
+                in when querying many sites of the same structure to avoid
+                repeating the symmetry analysis.
+        Returns:
+            equivs: List of sites symmetrically equivalent to site
+        """
+        if sym_struct is None:
+            sym_struct = self._get_symmetrized_structure(s)
+        equivs = sym_struct.find_equivalent_sites(site)
+        return equivs
+
+    @staticmethod
+    def _get_symmetrized_structure(s):
+        """Analyze the space group symmetry of a structure.
+
+        Args:
+            s: Pymatgen Structure object
+        Returns:
+            sym_struct: SymmetrizedStructure of s
+        """
         sga = SpacegroupAnalyzer(s, symprec=0.01)
         sg = sga.get_space_group_operations
         sym_data = sga.get_symmetry_dataset()
         equiv_atoms = sym_data["equivalent_atoms"]
         wyckoffs = sym_data["wyckoffs"]
-        sym_struct = SymmetrizedStructure(s, sg, equiv_atoms, wyckoffs)
-        equivs = sym_struct.find_equivalent_sites(site)
-        return equivs
+        return SymmetrizedStructure(s, sg, equiv_atoms, wyckoffs)
 
     def calc_bv_sum(self, site_val, site_el, neighbor_list):
         """Computes bond valence sum for site.
@@ -3648,9 +3671,12 @@ class GlobalInstabilityIndex(BaseFeaturizer):
         pairs = s.get_all_neighbors(r=cutoff)
         site_val_sums = {} # Cache bond valence deviations
 
+        # The symmetry analysis is shared by all sites, so only do it once
+        sym_struct = self._get_symmetrized_structure(s)
+
         for i, neighbor_list in enumerate(pairs):
             site = s[i]
-            equivs = self.get_equiv_sites(s, site)
+            equivs = self.get_equiv_sites(s, site, sym_struct=sym_struct)
             flag = False
 
             # If symm. identical site has cached bond valence sum difference,
@@ -459,6 +459,17 @@ class FingerprintTests(PymatgenTest):
         self.assertAlmostEqual(gsfs['G4_0.005_4.0_1.0'][0], 1.1810690738596332)
         self.assertAlmostEqual(gsfs['G4_0.005_4.0_-1.0'][0], 0.033850556557100071)
 
+        # g2 evaluates a list of etas the same as each eta on its own
+        rs = np.array([1.5, 2.5, 3.5, 7.0])
+        etas = [0.05, 4.]
+        self.assertArrayAlmostEqual(
+            GaussianSymmFunc.g2(etas, rs, 6.5),
+            [GaussianSymmFunc.g2(eta, rs, 6.5) for eta in etas])
+
+        # No neighbors gives zero for every eta
+        self.assertArrayAlmostEqual(
+            GaussianSymmFunc.g2(etas, np.array([]), 6.5), [0, 0])
+
     def test_ewald_site(self):
         ewald = EwaldSiteEnergy(accuracy=4)
 
@@ -859,6 +859,14 @@ class StructureFeaturesTest(PymatgenTest):
         self.assertTrue(gii.precheck(self.nacl))
         self.assertAlmostEqual(gii.featurize(self.nacl)[0], 0.08491655709)
 
+        # Equivalent sites are the same with or without a precomputed
+        # symmetrized structure
+        sym_struct = gii._get_symmetrized_structure(self.nacl)
+        for site in self.nacl:
+            self.assertEqual(
+                gii.get_equiv_sites(self.nacl, site),
+                gii.get_equiv_sites(self.nacl, site, sym_struct=sym_struct))
+
         # Test bond valence sums are accurate for NaCl.
         # Values are closer to 0.915 than 1.0 due to structure specified here.
         # Using CollCode181148 from the ICSD, I see bond valence sums of 0.979
@@ -291,11 +291,10 @@ class PropertyStats(object):
             alpha = sum(weights)
 
             if power == -1:
-                denom = 0
-                for idx, x in enumerate(data_lst):
-                    denom += weights[idx] / x
-
-                return sum(weights) / denom
+                if np.any(np.equal(data_lst, 0)):
+                    raise ZeroDivisionError("Holder mean with power -1 is "
+                                            "undefined for zero values")
+                return alpha / np.sum(np.true_divide(weights, data_lst))
 
             # If power=0, return geometric mean
             elif power == 0:
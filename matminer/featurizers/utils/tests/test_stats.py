@@ -82,6 +82,8 @@ class TestPropertyStats(TestCase):
 
         self.assertAlmostEqual(PropertyStats.holder_mean(
             [1, 2], [2, 1], power=-1), 1.2, places=3)
+        with self.assertRaises(ZeroDivisionError):
+            PropertyStats.holder_mean([0, 2], [2, 1], power=-1)
 
     def test_geom_std_dev(self):
         # This is right. Yes, a list without variation has a geom_std_dev of 1